@@ -1,14 +1,36 @@
 import logging
 
 import firebase_admin
-from google.cloud.firestore import Client
+from google.cloud.firestore import AsyncClient
 
 logger = logging.getLogger(__name__)
 
+# One client per database, shared process-wide: the first client pays the gRPC
+# channel handshake and credential fetch, and reusing it keeps the HTTP/2
+# channel (and its keepalive) warm for every repository.
+_CLIENT_CACHE: dict[str | None, AsyncClient] = {}
+
 
 def initialize_firebase():
     firebase_admin.initialize_app()
 
 
-def get_firestore_client(database: str | None = None) -> Client:
-    return Client(database=database)
+def get_firestore_client(database: str | None = None) -> AsyncClient:
+    client = _CLIENT_CACHE.get(database)
+    if client is None:
+        client = _CLIENT_CACHE.setdefault(database, AsyncClient(database=database))
+    return client
+
+
+async def close_firestore_clients() -> None:
+    """Close all cached Firestore clients (e.g. at application shutdown).
+
+    Closes each client's gRPC channel; the inherited sync close() only touches
+    the HTTP transport, which the gRPC-backed client never sets.
+    """
+    while _CLIENT_CACHE:
+        _, client = _CLIENT_CACHE.popitem()
+        try:
+            await client._firestore_api.transport.close()
+        except Exception as e:
+            logger.error(f"Failed to close Firestore client: {e}")
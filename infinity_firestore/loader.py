@@ -0,0 +1,94 @@
+import asyncio
+import logging
+from collections import defaultdict
+
+from google.cloud.firestore import AsyncClient
+from google.cloud.firestore_v1.base_document import DocumentSnapshot
+
+logger = logging.getLogger(__name__)
+
+_PendingEntry = tuple[str, asyncio.Future]
+
+
+class FirestoreBatchLoader:
+    """Coalesces concurrent single-document reads into multi-document RPCs.
+
+    Each load() parks its document ID on a pending batch and waits. The batch
+    is flushed after max_wait_ms, or immediately once max_batch_size IDs have
+    accumulated, using one get_all call per collection — so N concurrent reads
+    within the wait window cost one RPC instead of N.
+    """
+
+    def __init__(self, client: AsyncClient, max_wait_ms: float = 2.0, max_batch_size: int = 500):
+        self.client = client
+        self.max_wait_ms = max_wait_ms
+        self.max_batch_size = max_batch_size
+        self._pending: defaultdict[str, list[_PendingEntry]] = defaultdict(list)
+        self._pending_count = 0
+        self._flush_task: asyncio.Task | None = None
+        self._flush_early = asyncio.Event()
+
+    async def load(self, collection_name: str, doc_id: str) -> DocumentSnapshot:
+        """Fetch a document snapshot, coalescing with other in-flight loads."""
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._pending[collection_name].append((doc_id, future))
+        self._pending_count += 1
+
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+        if self._pending_count >= self.max_batch_size:
+            # Wake the flush loop instead of cancelling it: a cancel could land
+            # mid-RPC and abandon the batch it is resolving.
+            self._flush_early.set()
+
+        return await future
+
+    async def _flush_loop(self) -> None:
+        """Flush pending batches until none remain.
+
+        Looping (rather than one flush per task) covers loads that arrive while
+        a flush RPC is in flight: they land on the next pending batch, which
+        this task picks up on its next iteration. The loop only exits when no
+        entries are pending, so every load is covered by a scheduled flush.
+        """
+        while True:
+            try:
+                await asyncio.wait_for(self._flush_early.wait(), self.max_wait_ms / 1000)
+            except TimeoutError:
+                pass
+            self._flush_early.clear()
+            await self._flush()
+            if not self._pending_count:
+                return
+
+    async def _flush(self) -> None:
+        pending, self._pending = self._pending, defaultdict(list)
+        self._pending_count = 0
+
+        try:
+            for collection_name, entries in pending.items():
+                refs = [
+                    self.client.collection(collection_name).document(doc_id)
+                    for doc_id, _ in entries
+                ]
+                try:
+                    snapshots = {
+                        snapshot.reference.id: snapshot async for snapshot in self.client.get_all(refs)
+                    }
+                except Exception as e:
+                    logger.error(f"Failed to flush batched reads for {collection_name}: {e}")
+                    for _, future in entries:
+                        if not future.done():
+                            future.set_exception(e)
+                    continue
+
+                for doc_id, future in entries:
+                    if not future.done():
+                        future.set_result(snapshots[doc_id])
+        finally:
+            # If the flush is interrupted (e.g. cancelled), fail any futures
+            # still unresolved in the swapped-out batch so callers never hang.
+            for entries in pending.values():
+                for _, future in entries:
+                    if not future.done():
+                        future.cancel()
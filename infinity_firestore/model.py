@@ -1,10 +1,14 @@
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import partial
 
 from google.cloud.firestore_v1.base_collection import _auto_id
 from pydantic import BaseModel, Field
 
+# datetime.utcnow is deprecated since 3.12 and produces naive datetimes
+_utc_now = partial(datetime.now, timezone.utc)
+
 
 class Model(BaseModel):
     id: str = Field(default_factory=_auto_id)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utc_now)
+    updated_at: datetime = Field(default_factory=_utc_now)
@@ -1,25 +1,200 @@
+import asyncio
+import itertools
 import logging
 from datetime import datetime, timezone
-from typing import Any, Callable, Generic, Type, TypeVar, cast
-
-from google.cloud.firestore import Client, CollectionReference, Query
-from google.cloud.firestore_v1.base_query import FieldFilter
-from pydantic import BaseModel
+from types import UnionType
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Generic,
+    Iterable,
+    Iterator,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from google.api_core import exceptions as gcp_exceptions
+from google.cloud.firestore import (
+    AsyncClient,
+    AsyncCollectionReference,
+    AsyncQuery,
+    AsyncWriteBatch,
+    Query,
+)
+from google.cloud.firestore_v1.base_query import And, FieldFilter
+from pydantic import BaseModel, TypeAdapter
 
 from infinity_firestore import get_firestore_client
+from infinity_firestore.loader import FirestoreBatchLoader
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=BaseModel)
 U = TypeVar("U")
 
+# Firestore rejects batches with more than 500 mutations.
+MAX_BATCH_SIZE = 500
+
+# Batch commits racing against each other can hit transaction contention, so
+# retry the retryable errors with exponential backoff.
+_RETRYABLE_COMMIT_ERRORS = (gcp_exceptions.Aborted, gcp_exceptions.DeadlineExceeded)
+_MAX_COMMIT_ATTEMPTS = 5
+_INITIAL_RETRY_DELAY = 0.1
+
+
+def _chunked(items: Iterable[U], size: int) -> Iterator[list[U]]:
+    """Yield successive lists of at most `size` items."""
+    iterator = iter(items)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+# Types the Firestore client stores as-is, so a plain attribute read matches
+# what the pydantic serializer would produce.
+_PASSTHROUGH_TYPES = (str, int, float, bool, bytes, datetime)
+
+
+def _is_passthrough_annotation(annotation: Any) -> bool:
+    if annotation in _PASSTHROUGH_TYPES:
+        return True
+    if get_origin(annotation) in (Union, UnionType):
+        return all(arg is type(None) or arg in _PASSTHROUGH_TYPES for arg in get_args(annotation))
+    return False
+
+
+def _has_plain_fields(model_class: type[BaseModel]) -> bool:
+    """True if the model has no aliases, custom serializers, or computed fields."""
+    decorators = model_class.__pydantic_decorators__
+    if decorators.field_serializers or decorators.model_serializers:
+        return False
+    if model_class.model_computed_fields:
+        return False
+    # extra="allow" models carry unknown document keys through the generic
+    # path; the compiled converters only know the declared fields and would
+    # silently drop them.
+    if model_class.model_config.get("extra") == "allow":
+        return False
+    return all(
+        field_info.alias is None
+        and field_info.validation_alias is None
+        and field_info.serialization_alias is None
+        for field_info in model_class.model_fields.values()
+    )
+
+
+def _compile_from_dict(model_class: type[BaseModel]) -> Callable[[dict[str, Any], str], Any] | None:
+    """Generate a straight-line document-to-model converter for `model_class`.
+
+    The generated function reads exactly the known field names (missing ones
+    keep their defaults via model_construct) instead of going through the
+    generic dict-merging path. Returns None for models with aliases, custom
+    serializers, or computed fields, which need the generic path.
+    """
+    if not _has_plain_fields(model_class):
+        return None
+
+    lines = ["def _from_dict_fast(data, doc_id):", "    kw = {'id': doc_id}"]
+    for name in model_class.model_fields:
+        if name == "id":
+            continue
+        lines.append(f"    if {name!r} in data: kw[{name!r}] = data[{name!r}]")
+    lines.append("    return _construct(**kw)")
+
+    namespace: dict[str, Any] = {"_construct": model_class.model_construct}
+    exec("\n".join(lines), namespace)
+    return namespace["_from_dict_fast"]
+
+
+def _compile_to_dict(model_class: type[BaseModel]) -> Callable[[Any], dict[str, Any]] | None:
+    """Generate a straight-line model-to-dict converter for `model_class`.
+
+    Only produced when every stored field is a passthrough type, so a dict
+    literal of attribute reads is equivalent to the pydantic serializer.
+    """
+    if not _has_plain_fields(model_class):
+        return None
+    stored_fields = [name for name in model_class.model_fields if name != "id"]
+    if not all(
+        _is_passthrough_annotation(model_class.model_fields[name].annotation)
+        for name in stored_fields
+    ):
+        return None
+
+    items = ", ".join(f"{name!r}: model.{name}" for name in stored_fields)
+    namespace: dict[str, Any] = {}
+    exec(f"def _to_dict_fast(model):\n    return {{{items}}}", namespace)
+    return namespace["_to_dict_fast"]
+
+
+def _accept_any(value: Any) -> bool:
+    return True
+
+
+def _runtime_type(annotation: Any) -> type | None:
+    """Resolve an annotation to a runtime-checkable type, if one exists."""
+    if isinstance(annotation, type):
+        return annotation
+    origin = get_origin(annotation)
+    if isinstance(origin, type):  # list[str] -> list, dict[str, int] -> dict, ...
+        return origin
+    return None
+
+
+def build_check(annotation: Any) -> Callable[[Any], bool]:
+    """Compile an annotation into a value predicate, resolved once per field.
+
+    Handles Any, unions/optionals, and parametrized generics (by their origin);
+    anything that cannot be checked at runtime accepts every value.
+    """
+    if annotation is None or annotation is Any:
+        return _accept_any
+
+    if get_origin(annotation) in (Union, UnionType):
+        members = tuple(_runtime_type(arg) for arg in get_args(annotation) if arg is not Any)
+        if any(member is None for member in members):
+            return _accept_any
+        return lambda value: isinstance(value, members)
+
+    runtime_type = _runtime_type(annotation)
+    if runtime_type is None:
+        return _accept_any
+    return lambda value: isinstance(value, runtime_type)
+
+
+def build_element_check(annotation: Any) -> Callable[[Any], bool]:
+    """Compile a predicate for a sequence annotation's element type.
+
+    Used by the array-contains operators, whose values are compared against a
+    list field's elements rather than the field itself. Non-sequence (or
+    unparametrized) annotations accept every value.
+    """
+    if get_origin(annotation) in (list, set, frozenset, tuple):
+        args = get_args(annotation)
+        if args:
+            return build_check(args[0])
+    return _accept_any
+
 
 class FieldPath(Generic[U]):
     """Represents a single field path with type info."""
 
-    def __init__(self, name: str, type_: Type[U]):
+    __slots__ = ("name", "type_", "check", "element_check")
+
+    def __init__(
+        self,
+        name: str,
+        type_: Type[U],
+        check: Callable[[Any], bool] | None = None,
+        element_check: Callable[[Any], bool] | None = None,
+    ):
         self.name = name
         self.type_ = type_
+        self.check = check if check is not None else build_check(type_)
+        self.element_check = element_check if element_check is not None else build_element_check(type_)
 
     def __str__(self) -> str:
         return self.name
@@ -35,35 +210,70 @@ def safe_annotation(annotation: Any) -> type:
     return object  # Fallback for any other unexpected cases
 
 
+# FieldRef construction walks every model field, so build each one once and
+# share it across repositories and fields() calls.
+_FIELD_REF_CACHE: dict[type, "FieldRef"] = {}
+
+
 class FieldRef(Generic[T]):
     """Typed reference to a Pydantic model's fields."""
 
+    __slots__ = ("model_class", "_paths")
+
     def __init__(self, model_class: type[T]):
         self.model_class = model_class
-        for field_name, field_info in model_class.model_fields.items():
-            safe_type = safe_annotation(field_info.annotation)
-            setattr(self, field_name, FieldPath(field_name, safe_type))
+        self._paths: dict[str, FieldPath] = {
+            field_name: FieldPath(
+                field_name,
+                safe_annotation(field_info.annotation),
+                build_check(field_info.annotation),
+                build_element_check(field_info.annotation),
+            )
+            for field_name, field_info in model_class.model_fields.items()
+        }
 
     def __getattr__(self, name: str) -> FieldPath:
-        """Type hint for dynamic attribute access."""
-        # This helps type checkers understand dynamic attributes
+        """Dynamic attribute access for model field paths."""
         try:
-            return cast(FieldPath, super().__getattribute__(name))
-        except AttributeError:
+            return self._paths[name]
+        except KeyError:
             raise AttributeError(f"Field '{name}' does not exist in model {self.model_class.__name__}")
 
 
+# Membership operators compare against value shapes other than the field type:
+# 'in'/'not-in' take a list of candidate field values, and the array-contains
+# operators take element values of a list field. Both spellings are accepted.
+_IN_OPS = frozenset({"in", "not-in", "not_in"})
+_ARRAY_CONTAINS_OPS = frozenset({"array_contains", "array-contains"})
+_ARRAY_CONTAINS_ANY_OPS = frozenset({"array_contains_any", "array-contains-any"})
+
+
 class FirestoreQueryBuilder(Generic[T]):
     """Fluent builder with type-safe fields for constructing Firestore queries."""
 
-    def __init__(self, collection: CollectionReference, fields: FieldRef[T]):
-        self._query: CollectionReference | Query = collection
+    def __init__(self, collection: AsyncCollectionReference, fields: FieldRef[T]):
+        self._query: AsyncCollectionReference | AsyncQuery = collection
         self.fields = fields  # Store typed fields for reference
 
-    def where(self, field: FieldPath[U], op: str, value: U) -> "FirestoreQueryBuilder":
-        """Type-safe where clause."""
-        # Runtime type check (optional but recommended)
-        if not isinstance(value, field.type_):
+    def where(self, field: FieldPath[U], op: str, value: Any) -> "FirestoreQueryBuilder":
+        """Type-safe where clause.
+
+        The runtime check is operator-aware: comparison operators validate the
+        value against the field type, 'in'/'not-in' validate a list of field
+        values, and the array-contains operators validate against the list
+        field's element type.
+        """
+        # Runtime type checks, precompiled per field at FieldRef build time
+        if op in _IN_OPS:
+            if not isinstance(value, (list, tuple)) or not all(field.check(v) for v in value):
+                raise TypeError(f"Operator '{op}' on {field} requires a list of {field.type_} values")
+        elif op in _ARRAY_CONTAINS_OPS:
+            if not field.element_check(value):
+                raise TypeError(f"Value {value} does not match the element type of field {field}")
+        elif op in _ARRAY_CONTAINS_ANY_OPS:
+            if not isinstance(value, (list, tuple)) or not all(field.element_check(v) for v in value):
+                raise TypeError(f"Operator '{op}' on {field} requires a list of element values")
+        elif not field.check(value):
             raise TypeError(f"Value {value} does not match field type {field.type_}")
         self._query = self._query.where(filter=FieldFilter(str(field), op, value))
         return self
@@ -73,6 +283,15 @@ class FirestoreQueryBuilder(Generic[T]):
         self._query = self._query.order_by(str(field), direction=direction)
         return self
 
+    def select(self, *fields: FieldPath) -> "FirestoreQueryBuilder":
+        """Project only the given fields server-side.
+
+        Cuts bytes over the wire and client-side parsing to the selected
+        fields; non-projected model fields fall back to their defaults.
+        """
+        self._query = self._query.select([str(field) for field in fields])
+        return self
+
     def limit(self, count: int) -> "FirestoreQueryBuilder":
         """Limit the number of results."""
         self._query = self._query.limit(count)
@@ -83,68 +302,106 @@ class FirestoreQueryBuilder(Generic[T]):
         self._query = self._query.offset(num_to_skip)
         return self
 
-    def build(self) -> CollectionReference | Query:
+    def build(self) -> AsyncCollectionReference | AsyncQuery:
         """Return the built Firestore Query object."""
         return self._query
 
+    async def stream(self, from_dict_func: Callable) -> AsyncIterator[T]:
+        """Stream query results lazily, yielding models as documents arrive."""
+        async for doc in self.build().stream():
+            if data := doc.to_dict():
+                yield from_dict_func(data, doc.id)
+
     async def execute(self, from_dict_func: Callable) -> list[T]:
         """Execute the query and return results as list of models."""
-        docs = self.build().stream()
-        return [from_dict_func(doc.to_dict(), doc.id) for doc in docs if doc.to_dict()]
+        return [model async for model in self.stream(from_dict_func)]
 
 
 class FirestoreRepository(Generic[T]):
     """Generic Firestore repository for CRUD operations with Pydantic models."""
 
-    def __init__(self, database_name: str, collection_name: str, model_class: Type[T]):
+    def __init__(
+        self,
+        database_name: str,
+        collection_name: str,
+        model_class: Type[T],
+        max_workers: int = 40,
+        loader: FirestoreBatchLoader | None = None,
+        validate_reads: bool = False,
+    ):
         self.database_name = database_name
         self.collection_name = collection_name
         self.model_class = model_class
-        self._db: Client | None = None
+        self.max_workers = max_workers
+        self.loader = loader
+        self.validate_reads = validate_reads
+        self._db: AsyncClient | None = None
+        self._collection: AsyncCollectionReference | None = None
+        self._index_order: dict[str, int] = {}
+        # Hoist per-call pydantic machinery: the TypeAdapter caches the core
+        # serialization schema, so repeated dumps skip schema resolution.
+        self._adapter: TypeAdapter[T] = TypeAdapter(model_class)
+        self._dump_exclude = {"id"}
+        self._fields_ref = _FIELD_REF_CACHE.setdefault(model_class, FieldRef(model_class))
+        # Specialized converters generated per model class; None means the
+        # model needs the generic pydantic path.
+        self._from_dict_fast = None if validate_reads else _compile_from_dict(model_class)
+        self._to_dict_fast = _compile_to_dict(model_class)
 
     @property
-    def db(self) -> Client:
+    def db(self) -> AsyncClient:
         """Lazy initialization of Firestore client."""
         if self._db is None:
             self._db = get_firestore_client(self.database_name)
         return self._db
 
     @property
-    def collection(self):
-        """Get the Firestore collection reference."""
-        return self.db.collection(self.collection_name)
+    def collection(self) -> AsyncCollectionReference:
+        """Get the Firestore collection reference (cached per instance)."""
+        if self._collection is None:
+            self._collection = self.db.collection(self.collection_name)
+        return self._collection
 
     def fields(self) -> FieldRef[T]:
-        """Get typed field references for the model."""
-        return FieldRef(self.model_class)
+        """Get typed field references for the model (cached per model class)."""
+        return self._fields_ref
 
     def _to_dict(self, model: T) -> dict[str, Any]:
-        """Convert Pydantic model to dictionary for Firestore storage."""
-        data = model.model_dump(exclude={"id"})
-        # Convert datetime objects to Firestore timestamps
-        for key, value in data.items():
-            if isinstance(value, datetime):
-                data[key] = value
-        return data
+        """Convert Pydantic model to dictionary for Firestore storage.
+
+        datetime values are passed through as-is; the Firestore client converts
+        them to Timestamps natively.
+        """
+        if self._to_dict_fast is not None:
+            return self._to_dict_fast(model)
+        return self._adapter.dump_python(model, exclude=self._dump_exclude)
 
     def _from_dict(self, data: dict[str, Any] | None, doc_id: str) -> T:
-        """Convert Firestore document to Pydantic model."""
+        """Convert Firestore document to Pydantic model.
+
+        By default the data is trusted (Firestore is the source of truth) and
+        models are built with model_construct, skipping validation and coercion.
+        Pass validate_reads=True to the repository to re-validate on read.
+        """
+        if self._from_dict_fast is not None:
+            return self._from_dict_fast(data or {}, doc_id)
         if not data:
             data = {}
         data.update({"id": doc_id})
-        return self.model_class(**data)
+        if self.validate_reads:
+            return self.model_class(**data)
+        return self.model_class.model_construct(**data)
 
     async def create(self, model: T) -> T:
         """Create a new document in Firestore."""
         try:
             data = self._to_dict(model)
             doc_ref = self.collection.document()
-            doc_ref.create(data)
+            await doc_ref.create(data)
 
-            # Return model with generated ID
-            model_dict = model.model_dump()
-            model_dict["id"] = doc_ref.id
-            result = self.model_class(**model_dict)
+            # Return model with generated ID; model_copy skips re-validation,
+            # which is safe because the input is already a validated model.
+            result = model.model_copy(update={"id": doc_ref.id})
 
             logger.info(f"Created {self.collection_name} document with ID: {doc_ref.id}")
             return result
@@ -154,9 +411,16 @@ class FirestoreRepository(Generic[T]):
             raise
 
     async def get_by_id(self, doc_id: str) -> T | None:
-        """Get a document by ID."""
+        """Get a document by ID.
+
+        When a FirestoreBatchLoader is configured, concurrent calls within its
+        wait window are coalesced into a single multi-document read.
+        """
         try:
-            doc = self.collection.document(doc_id).get()
+            if self.loader is not None:
+                doc = await self.loader.load(self.collection_name, doc_id)
+            else:
+                doc = await self.collection.document(doc_id).get()
             if not doc.exists:
                 return None
 
@@ -167,19 +431,50 @@ class FirestoreRepository(Generic[T]):
             logger.error(f"Failed to get {self.collection_name} document {doc_id}: {e}")
             raise
 
-    async def update(self, doc_id: str, model: T) -> T:
-        """Update an existing document."""
+    async def get_many(self, doc_ids: list[str]) -> list[T | None]:
+        """Get multiple documents by ID in a single round trip per 500 IDs.
+
+        Uses Firestore's multi-document read (one BatchGetDocuments RPC per
+        chunk) instead of one round trip per document. Results are returned in
+        input order, with None for documents that do not exist.
+        """
         try:
-            data = self._to_dict(model)
-            data["updated_at"] = datetime.now(tz=timezone.utc)
+            semaphore = asyncio.Semaphore(self.max_workers)
+
+            async def fetch(ids: list[str]):
+                async with semaphore:
+                    refs = [self.collection.document(i) for i in ids]
+                    return [snapshot async for snapshot in self.db.get_all(refs)]
+
+            chunks = list(_chunked(doc_ids, MAX_BATCH_SIZE))
+            snapshots_by_id = {}
+            for snapshots in await asyncio.gather(*(fetch(chunk) for chunk in chunks)):
+                for snapshot in snapshots:
+                    snapshots_by_id[snapshot.reference.id] = snapshot
+
+            results: list[T | None] = []
+            for doc_id in doc_ids:
+                snapshot = snapshots_by_id.get(doc_id)
+                if snapshot is not None and snapshot.exists:
+                    results.append(self._from_dict(snapshot.to_dict(), snapshot.reference.id))
+                else:
+                    results.append(None)
+            return results
 
-            self.collection.document(doc_id).update(data)
+        except Exception as e:
+            logger.error(f"Failed to get {self.collection_name} documents {doc_ids}: {e}")
+            raise
 
-            # Return updated model
-            model_dict = model.model_dump()
-            model_dict["id"] = doc_id
-            model_dict["updated_at"] = data["updated_at"]
-            result = self.model_class(**model_dict)
+    async def update(self, doc_id: str, model: T) -> T:
+        """Update an existing document. Stamps updated_at on the model."""
+        try:
+            # Stamp updated_at before serializing so the timestamp is written once
+            result = model.model_copy(
+                update={"id": doc_id, "updated_at": datetime.now(tz=timezone.utc)}
+            )
+            data = self._to_dict(result)
+
+            await self.collection.document(doc_id).update(data)
 
             logger.info(f"Updated {self.collection_name} document: {doc_id}")
             return result
@@ -191,7 +486,7 @@ class FirestoreRepository(Generic[T]):
     async def delete(self, doc_id: str) -> bool:
         """Delete a document by ID."""
         try:
-            self.collection.document(doc_id).delete()
+            await self.collection.document(doc_id).delete()
             logger.info(f"Deleted {self.collection_name} document: {doc_id}")
             return True
 
@@ -199,15 +494,120 @@ class FirestoreRepository(Generic[T]):
             logger.error(f"Failed to delete {self.collection_name} document {doc_id}: {e}")
             raise
 
+    async def _commit_with_retry(self, batch: AsyncWriteBatch) -> None:
+        """Commit a batch, retrying contention errors with exponential backoff."""
+        delay = _INITIAL_RETRY_DELAY
+        for attempt in range(1, _MAX_COMMIT_ATTEMPTS + 1):
+            try:
+                await batch.commit()
+                return
+            except _RETRYABLE_COMMIT_ERRORS as e:
+                if attempt == _MAX_COMMIT_ATTEMPTS:
+                    raise
+                logger.warning(
+                    f"Retrying {self.collection_name} batch commit (attempt {attempt}): {e}"
+                )
+                await asyncio.sleep(delay)
+                delay *= 2
+
+    async def _commit_batches(self, batches: list[AsyncWriteBatch]) -> None:
+        """Commit batches concurrently, at most max_workers in flight at once."""
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def commit(batch: AsyncWriteBatch) -> None:
+            async with semaphore:
+                await self._commit_with_retry(batch)
+
+        await asyncio.gather(*(commit(batch) for batch in batches))
+
+    async def bulk_create(self, models: list[T]) -> list[T]:
+        """Create multiple documents using batched writes.
+
+        Each WriteBatch commits up to 500 mutations (Firestore's hard limit) in a
+        single round trip, and up to max_workers batches are committed
+        concurrently, so this is far cheaper than calling create() in a loop.
+        """
+        try:
+            batches = []
+            doc_refs = []
+            for chunk in _chunked(models, MAX_BATCH_SIZE):
+                batch = self.db.batch()
+                for model in chunk:
+                    doc_ref = self.collection.document()
+                    batch.create(doc_ref, self._to_dict(model))
+                    doc_refs.append(doc_ref)
+                batches.append(batch)
+            await self._commit_batches(batches)
+
+            results = [
+                model.model_copy(update={"id": doc_ref.id})
+                for model, doc_ref in zip(models, doc_refs)
+            ]
+
+            logger.info(f"Bulk created {len(results)} {self.collection_name} documents")
+            return results
+
+        except Exception as e:
+            logger.error(f"Failed to bulk create {self.collection_name} documents: {e}")
+            raise
+
+    async def bulk_update(self, models: list[T]) -> list[T]:
+        """Update multiple documents (keyed by model.id) using batched writes."""
+        try:
+            updated_at = datetime.now(tz=timezone.utc)
+            results = [model.model_copy(update={"updated_at": updated_at}) for model in models]
+
+            batches = []
+            for chunk in _chunked(results, MAX_BATCH_SIZE):
+                batch = self.db.batch()
+                for model in chunk:
+                    batch.update(self.collection.document(model.id), self._to_dict(model))
+                batches.append(batch)
+            await self._commit_batches(batches)
+
+            logger.info(f"Bulk updated {len(results)} {self.collection_name} documents")
+            return results
+
+        except Exception as e:
+            logger.error(f"Failed to bulk update {self.collection_name} documents: {e}")
+            raise
+
+    async def bulk_delete(self, doc_ids: list[str]) -> bool:
+        """Delete multiple documents by ID using batched writes."""
+        try:
+            batches = []
+            for chunk in _chunked(doc_ids, MAX_BATCH_SIZE):
+                batch = self.db.batch()
+                for doc_id in chunk:
+                    batch.delete(self.collection.document(doc_id))
+                batches.append(batch)
+            await self._commit_batches(batches)
+
+            logger.info(f"Bulk deleted {len(doc_ids)} {self.collection_name} documents")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to bulk delete {self.collection_name} documents: {e}")
+            raise
+
+    async def iter_all(self, limit: int | None = None) -> AsyncIterator[T]:
+        """Iterate over all documents, yielding models as the stream produces them.
+
+        Unlike list_all, memory stays bounded and the first result is available
+        before the full collection has been read.
+        """
+        query = self.collection
+        if limit:
+            query = query.limit(limit)
+
+        async for doc in query.stream():
+            if data := doc.to_dict():
+                yield self._from_dict(data, doc.id)
+
     async def list_all(self, limit: int | None = None) -> list[T]:
         """List all documents in the collection."""
         try:
-            query = self.collection
-            if limit:
-                query = query.limit(limit)
-
-            docs = query.stream()
-            return [self._from_dict(doc.to_dict(), doc.id) for doc in docs]
+            return [model async for model in self.iter_all(limit)]
 
         except Exception as e:
             logger.error(f"Failed to list {self.collection_name} documents: {e}")
@@ -216,22 +616,51 @@ class FirestoreRepository(Generic[T]):
     async def find_by_field(self, field: str, value: Any) -> list[T]:
         """Find documents by a specific field value."""
         try:
-            docs = self.collection.where(filter=FieldFilter(field, "==", value)).stream()
-            return [self._from_dict(doc.to_dict(), doc.id) for doc in docs if doc.to_dict()]
+            query = self.collection.where(filter=FieldFilter(field, "==", value))
+            return [
+                self._from_dict(data, doc.id)
+                async for doc in query.stream()
+                if (data := doc.to_dict())
+            ]
 
         except Exception as e:
             logger.error(f"Failed to find {self.collection_name} documents by {field}: {e}")
             raise
 
+    def index_hint(self, order: list[str]) -> None:
+        """Declare the field order of the collection's composite index.
+
+        find_by_fields sorts its filters into this order so multi-field queries
+        match the declared index prefix instead of whatever order the keyword
+        arguments happen to arrive in.
+        """
+        self._index_order = {field: position for position, field in enumerate(order)}
+
     async def find_by_fields(self, **fields: Any) -> list[T]:
         """Find documents by multiple field values using keyword arguments."""
-        try:
-            query: CollectionReference | Query = self.collection
-            for field, value in fields.items():
-                query = query.where(filter=FieldFilter(field, "==", value))
+        if not fields:
+            return await self.list_all()
+        if len(fields) == 1:
+            ((field, value),) = fields.items()
+            return await self.find_by_field(field, value)
 
-            docs = query.stream()
-            return [self._from_dict(doc.to_dict(), doc.id) for doc in docs if doc.to_dict()]
+        try:
+            items = fields.items()
+            if self._index_order:
+                last = len(self._index_order)
+                items = sorted(items, key=lambda item: self._index_order.get(item[0], last))
+
+            # Build all filters up front and apply them as one composite filter
+            # instead of chaining where() calls, which constructs a fresh query
+            # object per field.
+            filters = [FieldFilter(field, "==", value) for field, value in items]
+            query = self.collection.where(filter=And(filters))
+
+            return [
+                self._from_dict(data, doc.id)
+                async for doc in query.stream()
+                if (data := doc.to_dict())
+            ]
 
         except Exception:
             logger.error(f"Failed to find {self.collection_name} documents by fields: {fields}")